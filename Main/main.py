@@ -4,6 +4,14 @@ from pathlib import Path
 import math
 import os
 import subprocess
+import threading
+import queue
+import time
+import argparse
+import select
+import socket
+import stat
+import tempfile
 import pygame
 # optional fast array ops for resampling sounds
 try:
@@ -21,6 +29,22 @@ LOGO_FILE = DATA / "Daim.png"
 BG_FILE = DATA / "windows_XP.jpg"
 SOUND_FILE = DATA / "sound.mp3"
 
+# ---------- Command line ----------
+# Daemon mode keeps a hidden, fully warmed-up instance waiting on a Unix socket
+# so an idle detector can bring the screensaver up instantly (see
+# tools/screensaver_client.py for a stand-in client).
+DEFAULT_SOCKET = Path(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()) / "daim-bouncer.sock"
+arg_parser = argparse.ArgumentParser(description="Daim DVD screensaver")
+arg_parser.add_argument("--daemon", action="store_true",
+                        help="preload everything and wait for activate/deactivate commands")
+arg_parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET,
+                        help=f"control socket path for --daemon (default: {DEFAULT_SOCKET})")
+arg_parser.add_argument("--fullscreen", action="store_true",
+                        help="with --daemon, activate in fullscreen instead of a window")
+arg_parser.add_argument("--pacing-stats", action="store_true",
+                        help="print a frame-pacing jitter histogram on exit")
+ARGS = arg_parser.parse_args()
+
 # ---------- Pygame setup ----------
 pygame.init()
 try:
@@ -44,10 +68,11 @@ FLAGS_WINDOWED = pygame.RESIZABLE | pygame.DOUBLEBUF
 # track last good windowed size so we can restore after fullscreen
 last_windowed_size = WINDOWED_SIZE
 prev_window_size = WINDOWED_SIZE
-screen = pygame.display.set_mode(WINDOWED_SIZE, FLAGS_WINDOWED)
+# in daemon mode the window exists (so assets can be converted to its pixel
+# format) but stays hidden until the first "activate"
+screen = pygame.display.set_mode(WINDOWED_SIZE, FLAGS_WINDOWED | (pygame.HIDDEN if ARGS.daemon else 0))
 pygame.display.set_caption("Daim DVD Screensaver")
 
-clock = pygame.time.Clock()
 FPS = 60
 
 # Speed multiplier controls (user-adjustable between MIN and MAX)
@@ -99,6 +124,17 @@ if MIXER_OK and TAP_FILE.exists():
         print(f"Warning: couldn't load tap sound {TAP_FILE}: {e}")
 
 # ---------- Helpers ----------
+# images pre-scaled by warm_caches() (daemon mode), keyed by (source, size).
+# Scaled images are only ever blitted from, so they can be shared. Any other
+# size, e.g. from an interactive resize, is scaled on demand and not kept.
+prescaled = {}
+
+def smoothscale_cached(src, size):
+    scaled = prescaled.get((src, size))
+    if scaled is None:
+        scaled = pygame.transform.smoothscale(src, size)
+    return scaled
+
 def scale_bg_to_fill(surface, bg):
     sw, sh = surface.get_size()
     bw, bh = bg.get_size()
@@ -106,7 +142,7 @@ def scale_bg_to_fill(surface, bg):
         return bg
     scale = max(sw / bw, sh / bh)
     new_size = (int(bw * scale), int(bh * scale))
-    return pygame.transform.smoothscale(bg, new_size)
+    return smoothscale_cached(bg, new_size)
 
 def blit_bg(surface, bg_scaled):
     sw, sh = surface.get_size()
@@ -124,7 +160,7 @@ def fit_logo_to_window(surface, logo_img):
     scale = min(max_side / lw, max_side / lh, 1.0)
     if scale < 1.0:
         new_size = (max(1, int(lw * scale)), max(1, int(lh * scale)))
-        return pygame.transform.smoothscale(logo_img, new_size)
+        return smoothscale_cached(logo_img, new_size)
     return logo_img
 
 def safe_random_pos(surface, rect):
@@ -133,38 +169,28 @@ def safe_random_pos(surface, rect):
     y_max = max(0, sh - rect.height)
     return random.randint(0, x_max), random.randint(0, y_max)
 
-def play_bounce():
-    # Play bounce sound; when NumPy is available, resample to match speed_multiplier
-    if not bounce_sfx:
-        return
-    if NUMPY_OK and bounce_sfx is not None:
-        key = round(speed_multiplier, 2)
-        s = bounce_cache.get(key)
-        if s:
-            s.play()
-            return
+def bounce_sound_for(multiplier):
+    """Return the bounce sound resampled to match `multiplier` (cached per
+    rounded multiplier). Falls back to the original sound without NumPy or if
+    resampling fails."""
+    global orig_bounce_array
+    if not NUMPY_OK:
+        return bounce_sfx
+    key = round(multiplier, 2)
+    s = bounce_cache.get(key)
+    if s:
+        return s
+    try:
         # lazily load original array
-        global orig_bounce_array
-        try:
-            if orig_bounce_array is None:
-                orig_bounce_array = pygame.sndarray.array(bounce_sfx)
-        except Exception:
-            # fallback
-            try:
-                bounce_sfx.play()
-            except Exception:
-                pass
-            return
-
-        try:
-            arr = orig_bounce_array
-            # arr may be int16 or similar; convert to float for interpolation
-            orig_len = arr.shape[0]
-            if speed_multiplier == 1.0 or orig_len < 2:
-                bounce_cache[key] = bounce_sfx
-                bounce_sfx.play()
-                return
-            new_len = max(1, int(round(orig_len / float(speed_multiplier))))
+        if orig_bounce_array is None:
+            orig_bounce_array = pygame.sndarray.array(bounce_sfx)
+        arr = orig_bounce_array
+        # arr may be int16 or similar; convert to float for interpolation
+        orig_len = arr.shape[0]
+        if multiplier == 1.0 or orig_len < 2:
+            s = bounce_sfx
+        else:
+            new_len = max(1, int(round(orig_len / float(multiplier))))
             # generate indices in original sample space
             orig_idx = np.arange(orig_len)
             new_idx = np.linspace(0, orig_len - 1, new_len)
@@ -176,22 +202,21 @@ def play_bounce():
                 resampled = np.zeros((new_len, chans), dtype=arr.dtype)
                 for c in range(chans):
                     resampled[:, c] = np.interp(new_idx, orig_idx, arr[:, c].astype(np.float32)).astype(arr.dtype)
-            new_sound = pygame.sndarray.make_sound(resampled)
-            bounce_cache[key] = new_sound
-            new_sound.play()
-            return
-        except Exception:
-            # any error -> fallback to normal playback
-            try:
-                bounce_sfx.play()
-            except Exception:
-                pass
-            return
-    else:
-        try:
-            bounce_sfx.play()
-        except Exception:
-            pass
+            s = pygame.sndarray.make_sound(resampled)
+    except Exception:
+        # any error -> fallback to normal playback
+        return bounce_sfx
+    bounce_cache[key] = s
+    return s
+
+def play_bounce():
+    # Play bounce sound; when NumPy is available, resample to match speed_multiplier
+    if not bounce_sfx:
+        return
+    try:
+        bounce_sound_for(speed_multiplier).play()
+    except Exception:
+        pass
 
 def play_tap():
     if tap_sfx:
@@ -222,6 +247,139 @@ def make_velocity(surface, keep_dir=None):
             dx, dy = dx / mag, dy / mag
     return dx * sps * speed_multiplier, dy * sps * speed_multiplier
 
+# ---------- Frame pacing ----------
+PACER_SPIN_MAX = 0.0001   # seconds; only spin when sleep overshoot is known to be this small
+PACER_SNAP = 0.25         # intervals within 25% of the average rate count as "on schedule"
+PACER_DT_MAX = 0.1        # never step physics more than this in one frame (hitches, video)
+PACER_HIST_BIN_MS = 0.25  # jitter histogram bucket width
+PACER_HIST_BINS = 16      # buckets each side of zero; outliers collect in the end buckets
+
+class FramePacer:
+    """Deadline-based replacement for `clock.tick(FPS)`.
+
+    Frames are scheduled on a fixed grid of deadlines rather than "period after
+    the last frame", so lateness in one frame doesn't push back every later
+    one. The pacer learns how late its sleeps wake up. On a precise timer
+    (overshoot within PACER_SPIN_MAX) it sleeps until that much before the
+    deadline and busy-waits the rest, which is never more than
+    PACER_SPIN_MAX. On a coarser timer a spin long enough to help would cost
+    more CPU than `tick`, so it sleeps straight to the deadline instead.
+
+    `tick()` returns a smoothed dt for the physics step: frames that arrive on
+    schedule all get the same (average) frame time, while real hitches pass
+    through the measured time, capped at PACER_DT_MAX.
+
+    Jitter statistics are only gathered when `collect_stats` is set; the
+    bookkeeping is a measurable share of the per-frame cost otherwise."""
+
+    def __init__(self, fps, collect_stats=False):
+        self.period = 1.0 / fps
+        self.collect_stats = collect_stats
+        self.oversleep = 0.0
+        self.hist = [0] * (2 * PACER_HIST_BINS)
+        self.frames = 0
+        self.jitter_sum = 0.0
+        self.jitter_sq_sum = 0.0
+        self.jitter_worst = 0.0
+        self.missed = 0
+        self.reset()
+
+    def reset(self):
+        """Forget the frame schedule, e.g. after the loop was paused for a video."""
+        self.deadline = None
+        self.last = None
+        self.avg_dt = self.period
+
+    def _record(self, jitter):
+        self.frames += 1
+        self.jitter_sum += jitter
+        self.jitter_sq_sum += jitter * jitter
+        if abs(jitter) > abs(self.jitter_worst):
+            self.jitter_worst = jitter
+        if jitter > self.period:
+            self.missed += 1
+        i = int(math.floor(jitter * 1000.0 / PACER_HIST_BIN_MS)) + PACER_HIST_BINS
+        self.hist[max(0, min(len(self.hist) - 1, i))] += 1
+
+    def tick(self):
+        """Wait for the next frame deadline; return the smoothed dt in seconds."""
+        # this runs straight after a long sleep with cold caches, so keep the
+        # path short: two perf_counter() calls per frame unless spinning
+        now = time.perf_counter()
+        deadline = self.deadline
+        if deadline is None:
+            # first frame after a (re)start goes out immediately
+            deadline = now
+        oversleep = self.oversleep
+        spin = oversleep <= PACER_SPIN_MAX
+        target = deadline - now - (oversleep if spin else 0.0)
+        if target > 0.0:
+            time.sleep(target)
+            woke = time.perf_counter()
+            overshoot = woke - now - target
+            # follow the low end of the overshoot distribution: drop quickly on
+            # a prompt wake-up, creep up slowly on late ones. Leading by more
+            # than the typical overshoot would just be spent spinning.
+            if overshoot < oversleep:
+                self.oversleep = 0.5 * oversleep + 0.5 * max(0.0, overshoot)
+            else:
+                self.oversleep = 0.98 * oversleep + 0.02 * overshoot
+            now = woke
+        if spin:
+            while now < deadline:
+                now = time.perf_counter()
+        # next slot on the grid; if we fell a whole frame behind, resync instead
+        # of rushing several frames out back-to-back
+        deadline += self.period
+        if deadline < now:
+            deadline = now + self.period
+        self.deadline = deadline
+        last = self.last
+        self.last = now
+        if last is None:
+            return self.period
+        interval = now - last
+        if self.collect_stats:
+            self._record(interval - self.period)
+        avg_dt = self.avg_dt
+        if abs(interval - avg_dt) <= avg_dt * PACER_SNAP:
+            self.avg_dt = 0.95 * avg_dt + 0.05 * interval
+            return self.avg_dt
+        return min(interval, PACER_DT_MAX)
+
+    def report(self):
+        """Return a printable summary and histogram of frame-to-frame jitter."""
+        if not self.frames:
+            return "Frame pacing: no frames measured"
+        mean = self.jitter_sum / self.frames
+        std = math.sqrt(max(0.0, self.jitter_sq_sum / self.frames - mean * mean))
+        lines = [
+            f"Frame pacing: {self.frames} frames at {1.0 / self.period:.0f} FPS target, "
+            f"jitter mean {mean * 1000.0:+.3f} ms, std {std * 1000.0:.3f} ms, "
+            f"worst {self.jitter_worst * 1000.0:+.3f} ms, missed {self.missed}"
+        ]
+        peak = max(self.hist)
+        for i, count in enumerate(self.hist):
+            if not count:
+                continue
+            lo = (i - PACER_HIST_BINS) * PACER_HIST_BIN_MS
+            if i == 0:
+                label = f"      < {lo + PACER_HIST_BIN_MS:+.2f} ms"
+            elif i == len(self.hist) - 1:
+                label = f"     >= {lo:+.2f} ms"
+            else:
+                label = f"{lo:+.2f}..{lo + PACER_HIST_BIN_MS:+.2f} ms"
+            bar = "#" * max(1, int(round(40 * count / peak)))
+            lines.append(f"  {label:>18} {count:7d} {bar}")
+        return "\n".join(lines)
+
+pacer = FramePacer(FPS, collect_stats=ARGS.pacing_stats)
+
+def print_pacing_stats():
+    """Print the jitter report when running with --pacing-stats."""
+    if ARGS.pacing_stats:
+        print(pacer.report())
+
 # ---------- Prepare assets ----------
 bg_scaled = scale_bg_to_fill(screen, bg_src)
 
@@ -327,6 +485,162 @@ def ease_out_cubic(t: float) -> float:
         return 1.0
     return 1.0 - pow(1.0 - t, 3)
 
+# ---------- Endgame audio streaming ----------
+ENDGAME_AUDIO_CHUNK = 0.25  # seconds of audio decoded per chunk
+ENDGAME_AUDIO_AHEAD = 8     # decoded chunks buffered ahead of the mixer (~2s)
+
+class EndgameAudioStream:
+    """Stream a MoviePy audio clip into a reserved mixer channel.
+
+    A background thread decodes the track in small chunks (so the whole
+    soundtrack is never held in memory) and hands ready-made Sounds to the
+    main thread, which keeps the channel's one-deep queue topped up via
+    `pump()`. `clock()` is the media time currently being played and is used
+    as the master clock for video frame presentation."""
+
+    def __init__(self, audio_clip):
+        freq, size, channels = MIXER_INFO
+        if size == -16:
+            self.dtype = np.int16
+        elif size == 32:
+            self.dtype = np.float32
+        else:
+            raise ValueError(f"unsupported mixer sample format {size}")
+        self.audio_clip = audio_clip
+        self.freq = freq
+        self.channels = channels
+        self.chunks = queue.Queue(maxsize=ENDGAME_AUDIO_AHEAD)
+        self.stop_event = threading.Event()
+        self.finished = False  # decoder reached the end of the track (or failed)
+        self.thread = threading.Thread(target=self._decode, daemon=True)
+        self.channel = None
+        # clock = anchor_media + (now - anchor_wall), capped at submitted_end so
+        # the clock stalls instead of running ahead when the decoder underruns
+        self.anchor_media = 0.0
+        self.anchor_wall = None
+        self.submitted_end = 0.0
+        self.started_wall = None
+
+    def _to_mixer_format(self, chunk):
+        arr = np.asarray(chunk, dtype=np.float32)
+        if arr.ndim == 1:
+            arr = arr[:, None]
+        if arr.shape[1] != self.channels:
+            # downmix, then fan out to however many channels the mixer has
+            arr = np.repeat(arr.mean(axis=1, keepdims=True), self.channels, axis=1)
+        arr = np.clip(arr, -1.0, 1.0)
+        if self.dtype == np.int16:
+            arr = arr * 32767.0
+        arr = arr.astype(self.dtype)
+        if self.channels == 1:
+            arr = arr[:, 0]
+        return np.ascontiguousarray(arr)
+
+    def _decode(self):
+        media_t = 0.0
+        try:
+            for chunk in self.audio_clip.iter_chunks(chunk_duration=ENDGAME_AUDIO_CHUNK, fps=self.freq):
+                if self.stop_event.is_set():
+                    return
+                samples = self._to_mixer_format(chunk)
+                if samples.shape[0] == 0:
+                    continue
+                duration = samples.shape[0] / float(self.freq)
+                item = (pygame.sndarray.make_sound(samples), media_t, duration)
+                media_t += duration
+                while not self.stop_event.is_set():
+                    try:
+                        self.chunks.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+        except Exception as e:
+            print("Warning: endgame audio decode failed:", e)
+        finally:
+            self.finished = True
+
+    def start(self):
+        """Start decoding. Returns immediately; playback begins on the first
+        `pump()` after a chunk is ready, and `clock()` holds at 0 until then."""
+        pygame.mixer.set_reserved(1)
+        self.channel = pygame.mixer.Channel(0)
+        self.started_wall = time.perf_counter()
+        self.thread.start()
+
+    def _play(self, sound, media_t, duration):
+        self.channel.play(sound)
+        self.anchor_media = media_t
+        self.anchor_wall = time.perf_counter()
+        self.submitted_end = media_t + duration
+
+    def pump(self):
+        """Keep the channel fed; call at least once per video frame."""
+        if self.channel is None:
+            return
+        if not self.channel.get_busy():
+            # underrun (or not primed yet): restart playback and re-anchor the clock
+            try:
+                self._play(*self.chunks.get_nowait())
+            except queue.Empty:
+                return
+        if self.channel.get_queue() is None:
+            try:
+                sound, media_t, duration = self.chunks.get_nowait()
+            except queue.Empty:
+                return
+            # queued chunks follow on gaplessly, so the clock anchor stays valid
+            self.channel.queue(sound)
+            self.submitted_end = media_t + duration
+
+    def done(self):
+        return self.finished and self.chunks.empty() and not (self.channel and self.channel.get_busy())
+
+    def clock(self):
+        if self.anchor_wall is None:
+            if self.finished and self.started_wall is not None:
+                # the decoder gave up before producing anything: run on wall time
+                return time.perf_counter() - self.started_wall
+            return 0.0
+        t = self.anchor_media + (time.perf_counter() - self.anchor_wall)
+        if self.done():
+            # track ended (or was shorter than the video): keep running on wall time
+            return t
+        return min(t, self.submitted_end)
+
+    def stop(self):
+        self.stop_event.set()
+        if self.channel is not None:
+            self.channel.stop()
+        while True:
+            try:
+                self.chunks.get_nowait()
+            except queue.Empty:
+                break
+        if self.thread.ident is not None:
+            self.thread.join(timeout=1.0)
+        pygame.mixer.set_reserved(0)
+
+def endgame_interrupted():
+    """Drain window events (and daemon commands) during endgame playback;
+    True if the screensaver should be dismissed."""
+    interrupted = False
+    for ev in pygame.event.get():
+        if ev.type == pygame.QUIT:
+            interrupted = True
+        if ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
+            interrupted = True
+    return poll_control() or interrupted
+
+def stop_screensaver():
+    """Dismiss the screensaver: exit the process, or in daemon mode just end the
+    current activation so the main loop returns to waiting."""
+    global running
+    if control is None:
+        print_pacing_stats()
+        pygame.quit()
+        sys.exit(0)
+    running = False
+
 def play_endgame_then_restart():
     """Attempt to play `data/endgame.mp4` (MoviePy preferred). After the video
     finishes, restore the game window and reset the logo state to restart the
@@ -348,24 +662,66 @@ def play_endgame_then_restart():
         clip = VideoFileClip(str(video_path))
         # target size is current window size so playback fills the window
         sw, sh = screen.get_size()
-        for frame in clip.iter_frames(fps=clip.fps, dtype='uint8'):
-            # frame is (h, w, 3) RGB ndarray
+        frame_dur = 1.0 / clip.fps
+        # stream the soundtrack alongside the frames; its playback position is
+        # the master clock. Without audio, fall back to wall-clock pacing.
+        audio = None
+        if MIXER_OK and NUMPY_OK and MIXER_INFO and clip.audio is not None:
             try:
-                surf = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
-            except Exception:
-                surf = pygame.image.frombuffer(frame.tobytes(), (frame.shape[1], frame.shape[0]), 'RGB')
-            if surf.get_size() != (sw, sh):
-                surf = pygame.transform.smoothscale(surf, (sw, sh))
-            screen.blit(surf, (0, 0))
-            pygame.display.flip()
-            for ev in pygame.event.get():
-                if ev.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit(0)
-                if ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
-                    pygame.quit()
-                    sys.exit(0)
-        clip.close()
+                audio = EndgameAudioStream(clip.audio)
+                audio.start()
+            except Exception as e:
+                print("Warning: endgame audio unavailable:", e)
+                if audio is not None:
+                    audio.stop()
+                audio = None
+        wall_start = time.perf_counter()
+
+        def master_clock():
+            if audio is not None:
+                audio.pump()
+                return audio.clock()
+            return time.perf_counter() - wall_start
+
+        quit_requested = False
+        try:
+            for i, frame in enumerate(clip.iter_frames(fps=clip.fps, dtype='uint8')):
+                frame_t = i * frame_dur
+                now_t = master_clock()
+                if now_t - frame_t > frame_dur:
+                    # more than a frame behind the audio: drop it to catch up,
+                    # but still let Esc/QUIT through during a run of drops
+                    if endgame_interrupted():
+                        quit_requested = True
+                        break
+                    continue
+                # converting/scaling happens while we are still early, then hold
+                # the frame until its presentation time comes round
+                try:
+                    surf = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
+                except Exception:
+                    surf = pygame.image.frombuffer(frame.tobytes(), (frame.shape[1], frame.shape[0]), 'RGB')
+                if surf.get_size() != (sw, sh):
+                    surf = pygame.transform.smoothscale(surf, (sw, sh))
+                now_t = master_clock()
+                while now_t < frame_t and not quit_requested:
+                    time.sleep(min(frame_t - now_t, 0.005))
+                    # keep the window responsive while holding the frame
+                    quit_requested = endgame_interrupted()
+                    now_t = master_clock()
+                if quit_requested:
+                    break
+                screen.blit(surf, (0, 0))
+                pygame.display.flip()
+                if endgame_interrupted():
+                    quit_requested = True
+                    break
+        finally:
+            if audio is not None:
+                audio.stop()
+            clip.close()
+        if quit_requested:
+            stop_screensaver()
         played_inside = True
     except Exception:
         # try imageio reader (ffmpeg backend)
@@ -383,13 +739,9 @@ def play_endgame_then_restart():
                     surf = pygame.transform.smoothscale(surf, (sw, sh))
                 screen.blit(surf, (0, 0))
                 pygame.display.flip()
-                for ev in pygame.event.get():
-                    if ev.type == pygame.QUIT:
-                        pygame.quit()
-                        sys.exit(0)
-                    if ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
-                        pygame.quit()
-                        sys.exit(0)
+                if endgame_interrupted():
+                    stop_screensaver()
+                    break
             try:
                 reader.close()
             except Exception:
@@ -409,12 +761,15 @@ def play_endgame_then_restart():
                 # cannot play; just continue
                 pass
 
-    # After playback restore previous windowed size and restart the game
-    try:
-        screen = pygame.display.set_mode(last_windowed_size, FLAGS_WINDOWED)
-    except Exception:
-        screen = pygame.display.set_mode(last_windowed_size)
-    prev_window_size = last_windowed_size
+    # After playback restore the display mode we were in and restart the game
+    if is_fullscreen:
+        screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN | pygame.DOUBLEBUF)
+    else:
+        try:
+            screen = pygame.display.set_mode(last_windowed_size, FLAGS_WINDOWED)
+        except Exception:
+            screen = pygame.display.set_mode(last_windowed_size)
+        prev_window_size = last_windowed_size
     # recompute play surface and restart
     restart_game_state()
 
@@ -434,178 +789,19 @@ def restart_game_state():
     vel_x, vel_y = make_velocity(play_surf)
     approach_active = False
     approach_elapsed = 0.0
+    # the loop may have been paused (endgame video); don't count that as a frame
+    pacer.reset()
 
 # ---------- Main loop ----------
 running = True
-while running:
-    dt_ms = clock.tick(FPS)
-    dt = dt_ms / 1000.0  # seconds since last frame
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                running = False
-            elif event.key == pygame.K_F11:
-                toggle_fullscreen()
-            elif event.key == pygame.K_RIGHT:
-                # increase speed by factor, capped
-                old = speed_multiplier
-                speed_multiplier = min(SPEED_MAX, speed_multiplier * SPEED_STEP)
-                if speed_multiplier != old:
-                    # scale current velocity to match new multiplier
-                    ratio = speed_multiplier / old if old != 0 else speed_multiplier
-                    vel_x *= ratio
-                    vel_y *= ratio
-                    play_tap()
-                    try:
-                        hud_trigger_time = pygame.time.get_ticks() / 1000.0
-                    except Exception:
-                        hud_trigger_time = None
-            elif event.key == pygame.K_LEFT:
-                # decrease speed by factor, capped
-                old = speed_multiplier
-                speed_multiplier = max(SPEED_MIN, speed_multiplier / SPEED_STEP)
-                if speed_multiplier != old:
-                    ratio = speed_multiplier / old if old != 0 else speed_multiplier
-                    vel_x *= ratio
-                    vel_y *= ratio
-                    play_tap()
-                    try:
-                        hud_trigger_time = pygame.time.get_ticks() / 1000.0
-                    except Exception:
-                        hud_trigger_time = None
-        elif event.type == pygame.VIDEORESIZE and not is_fullscreen:
-            # Constrain resize to the target aspect ratio so the playfield doesn't become too tall or skinny.
-            def constrain_size_to_aspect(requested_size, prev_size):
-                req_w, req_h = requested_size
-                prev_w, prev_h = prev_size
-                min_w, min_h = MIN_WINDOW_SIZE
-                req_w = max(req_w, min_w)
-                req_h = max(req_h, min_h)
-                # Choose which dimension the user is primarily changing
-                if abs(req_w - prev_w) >= abs(req_h - prev_h):
-                    # width-driven change
-                    w = req_w
-                    h = max(min_h, int(round(w / ASPECT_RATIO)))
-                else:
-                    # height-driven change
-                    h = req_h
-                    w = max(min_w, int(round(h * ASPECT_RATIO)))
-                return (w, h)
-
-            # When the user resizes (including clicking the maximize button), we let
-            # the OS-set window size be the real `screen` size, but we compute a
-            # centered play area that preserves the aspect ratio and draw black
-            # bars around it. This keeps the gameplay area stable while visually
-            # filling the screen with black letter/pillar boxes.
-            new_size = (event.w, event.h)
-            screen = pygame.display.set_mode(new_size, FLAGS_WINDOWED)
-            prev_window_size = new_size
-            last_windowed_size = new_size
-            pw, ph, ox, oy = compute_play_area(screen.get_size())
-            play_surf = pygame.Surface((pw, ph))
-            bg_scaled = scale_bg_to_fill(play_surf, bg_src)
-            old_center = logo_rect.center
-            logo_img = fit_logo_to_window(play_surf, logo_src)
-            logo_rect.size = logo_img.get_size()
-            # clamp center inside play area
-            logo_rect.center = (max(0, min(old_center[0], pw)), max(0, min(old_center[1], ph)))
-            sw, sh = screen.get_size()
-            pos_x, pos_y = float(logo_rect.x), float(logo_rect.y)
-            vel_x, vel_y = make_velocity(play_surf, keep_dir=(vel_x, vel_y))
-
-    # --- Move using dt-based velocity inside play surface coordinates ---
-    pw, ph = play_surf.get_size()
-
-    if approach_active:
-        # Eased interpolation from start to target over APPROACH_TIME
-        approach_elapsed += dt
-        t = min(1.0, approach_elapsed / APPROACH_TIME)
-        e = ease_out_cubic(t)
-        nx = approach_start_x + (approach_target_x - approach_start_x) * e
-        ny = approach_start_y + (approach_target_y - approach_start_y) * e
-        logo_rect.x = int(nx)
-        logo_rect.y = int(ny)
-        pos_x = float(logo_rect.x)
-        pos_y = float(logo_rect.y)
-        if t >= 1.0:
-            # reached center
-            logo_rect.center = (pw // 2, ph // 2)
-            pos_x = float(logo_rect.x)
-            pos_y = float(logo_rect.y)
-            vel_x = 0.0
-            vel_y = 0.0
-            approach_active = False
-            # Play endgame video and restart when done
-            try:
-                play_endgame_then_restart()
-            except Exception:
-                # ensure we still restart even if video playback fails
-                restart_game_state()
-    else:
-        pos_x += vel_x * dt
-        pos_y += vel_y * dt
-        logo_rect.x = int(pos_x)
-        logo_rect.y = int(pos_y)
-
-        bounced_x = False
-        bounced_y = False
-
-        if logo_rect.left <= 0:
-            logo_rect.left = 0
-            pos_x = float(logo_rect.x)
-            vel_x = -vel_x
-            bounced_x = True
-        elif logo_rect.right >= pw:
-            logo_rect.right = pw
-            pos_x = float(logo_rect.x)
-            vel_x = -vel_x
-            bounced_x = True
-
-        if logo_rect.top <= 0:
-            logo_rect.top = 0
-            pos_y = float(logo_rect.y)
-            vel_y = -vel_y
-            bounced_y = True
-        elif logo_rect.bottom >= ph:
-            logo_rect.bottom = ph
-            pos_y = float(logo_rect.y)
-            vel_y = -vel_y
-            bounced_y = True
-
-        # If both axes bounced in the same frame (corner "sweet spot"), or we're very close
-        # to a corner (within NEAR_PERCENT of both axes), start approach-to-center.
-        # This is strict (1%) so it doesn't trigger too often.
-        pw_f = float(pw)
-        ph_f = float(ph)
-        near_x = (logo_rect.left <= pw_f * NEAR_PERCENT) or ((pw_f - logo_rect.right) <= pw_f * NEAR_PERCENT)
-        near_y = (logo_rect.top <= ph_f * NEAR_PERCENT) or ((ph_f - logo_rect.bottom) <= ph_f * NEAR_PERCENT)
-        if (bounced_x and bounced_y) or (near_x and near_y):
-            cx, cy = pw // 2, ph // 2
-            # initialize eased approach
-            approach_active = True
-            approach_elapsed = 0.0
-            approach_start_x = float(logo_rect.x)
-            approach_start_y = float(logo_rect.y)
-            approach_target_x = float(cx - (logo_rect.width // 2))
-            approach_target_y = float(cy - (logo_rect.height // 2))
-            # keep velocities zeroed while we approach
-            vel_x = 0.0
-            vel_y = 0.0
-            # don't play bounce sound for corner hit; it's handled by movement end
-            bounced = False
-        else:
-            bounced = bounced_x or bounced_y
-
-        if bounced:
-            play_bounce()
 
+def draw_frame():
+    """Render the current game state to the window."""
+    global hud_trigger_time
     # Draw: clear screen to black, draw play_surf centered and scaled to play area
     screen.fill((0, 0, 0))
-    # draw background into play surface and then blit logo
-    bg_scaled = scale_bg_to_fill(play_surf, bg_src)
+    # draw background into play surface and then blit logo; bg_scaled is kept
+    # up to date whenever play_surf changes size, so no per-frame rescale
     blit_bg(play_surf, bg_scaled)
     play_surf.blit(logo_img, logo_rect)
     # HUD: show current speed multiplier
@@ -643,4 +839,409 @@ while running:
     screen.blit(play_surf, (ox, oy))
     pygame.display.flip()
 
+def run_screensaver():
+    """Run the bouncing-logo loop until the user (or, in daemon mode, a
+    "deactivate" command) dismisses it."""
+    global running, screen, play_surf, bg_scaled, logo_img
+    global pos_x, pos_y, vel_x, vel_y, speed_multiplier, hud_trigger_time
+    global last_windowed_size, prev_window_size
+    global approach_active, approach_elapsed
+    global approach_start_x, approach_start_y, approach_target_x, approach_target_y
+    running = True
+    while running:
+        dt = pacer.tick()  # smoothed seconds since last frame
+
+        if poll_control():
+            running = False
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_F11:
+                    toggle_fullscreen()
+                elif event.key == pygame.K_RIGHT:
+                    # increase speed by factor, capped
+                    old = speed_multiplier
+                    speed_multiplier = min(SPEED_MAX, speed_multiplier * SPEED_STEP)
+                    if speed_multiplier != old:
+                        # scale current velocity to match new multiplier
+                        ratio = speed_multiplier / old if old != 0 else speed_multiplier
+                        vel_x *= ratio
+                        vel_y *= ratio
+                        play_tap()
+                        try:
+                            hud_trigger_time = pygame.time.get_ticks() / 1000.0
+                        except Exception:
+                            hud_trigger_time = None
+                elif event.key == pygame.K_LEFT:
+                    # decrease speed by factor, capped
+                    old = speed_multiplier
+                    speed_multiplier = max(SPEED_MIN, speed_multiplier / SPEED_STEP)
+                    if speed_multiplier != old:
+                        ratio = speed_multiplier / old if old != 0 else speed_multiplier
+                        vel_x *= ratio
+                        vel_y *= ratio
+                        play_tap()
+                        try:
+                            hud_trigger_time = pygame.time.get_ticks() / 1000.0
+                        except Exception:
+                            hud_trigger_time = None
+            elif event.type == pygame.VIDEORESIZE and not is_fullscreen:
+                # Constrain resize to the target aspect ratio so the playfield doesn't become too tall or skinny.
+                def constrain_size_to_aspect(requested_size, prev_size):
+                    req_w, req_h = requested_size
+                    prev_w, prev_h = prev_size
+                    min_w, min_h = MIN_WINDOW_SIZE
+                    req_w = max(req_w, min_w)
+                    req_h = max(req_h, min_h)
+                    # Choose which dimension the user is primarily changing
+                    if abs(req_w - prev_w) >= abs(req_h - prev_h):
+                        # width-driven change
+                        w = req_w
+                        h = max(min_h, int(round(w / ASPECT_RATIO)))
+                    else:
+                        # height-driven change
+                        h = req_h
+                        w = max(min_w, int(round(h * ASPECT_RATIO)))
+                    return (w, h)
+
+                # When the user resizes (including clicking the maximize button), we let
+                # the OS-set window size be the real `screen` size, but we compute a
+                # centered play area that preserves the aspect ratio and draw black
+                # bars around it. This keeps the gameplay area stable while visually
+                # filling the screen with black letter/pillar boxes.
+                new_size = (event.w, event.h)
+                screen = pygame.display.set_mode(new_size, FLAGS_WINDOWED)
+                prev_window_size = new_size
+                last_windowed_size = new_size
+                pw, ph, ox, oy = compute_play_area(screen.get_size())
+                play_surf = pygame.Surface((pw, ph))
+                bg_scaled = scale_bg_to_fill(play_surf, bg_src)
+                old_center = logo_rect.center
+                logo_img = fit_logo_to_window(play_surf, logo_src)
+                logo_rect.size = logo_img.get_size()
+                # clamp center inside play area
+                logo_rect.center = (max(0, min(old_center[0], pw)), max(0, min(old_center[1], ph)))
+                sw, sh = screen.get_size()
+                pos_x, pos_y = float(logo_rect.x), float(logo_rect.y)
+                vel_x, vel_y = make_velocity(play_surf, keep_dir=(vel_x, vel_y))
+
+        # --- Move using dt-based velocity inside play surface coordinates ---
+        pw, ph = play_surf.get_size()
+
+        if approach_active:
+            # Eased interpolation from start to target over APPROACH_TIME
+            approach_elapsed += dt
+            t = min(1.0, approach_elapsed / APPROACH_TIME)
+            e = ease_out_cubic(t)
+            nx = approach_start_x + (approach_target_x - approach_start_x) * e
+            ny = approach_start_y + (approach_target_y - approach_start_y) * e
+            logo_rect.x = round(nx)
+            logo_rect.y = round(ny)
+            pos_x = float(logo_rect.x)
+            pos_y = float(logo_rect.y)
+            if t >= 1.0:
+                # reached center
+                logo_rect.center = (pw // 2, ph // 2)
+                pos_x = float(logo_rect.x)
+                pos_y = float(logo_rect.y)
+                vel_x = 0.0
+                vel_y = 0.0
+                approach_active = False
+                # Play endgame video and restart when done
+                try:
+                    play_endgame_then_restart()
+                except Exception:
+                    # ensure we still restart even if video playback fails
+                    restart_game_state()
+        else:
+            pos_x += vel_x * dt
+            pos_y += vel_y * dt
+            # round (not truncate) so the on-screen position is never biased a pixel behind
+            logo_rect.x = round(pos_x)
+            logo_rect.y = round(pos_y)
+
+            bounced_x = False
+            bounced_y = False
+
+            if logo_rect.left <= 0:
+                logo_rect.left = 0
+                pos_x = float(logo_rect.x)
+                vel_x = -vel_x
+                bounced_x = True
+            elif logo_rect.right >= pw:
+                logo_rect.right = pw
+                pos_x = float(logo_rect.x)
+                vel_x = -vel_x
+                bounced_x = True
+
+            if logo_rect.top <= 0:
+                logo_rect.top = 0
+                pos_y = float(logo_rect.y)
+                vel_y = -vel_y
+                bounced_y = True
+            elif logo_rect.bottom >= ph:
+                logo_rect.bottom = ph
+                pos_y = float(logo_rect.y)
+                vel_y = -vel_y
+                bounced_y = True
+
+            # If both axes bounced in the same frame (corner "sweet spot"), or we're very close
+            # to a corner (within NEAR_PERCENT of both axes), start approach-to-center.
+            # This is strict (1%) so it doesn't trigger too often.
+            pw_f = float(pw)
+            ph_f = float(ph)
+            near_x = (logo_rect.left <= pw_f * NEAR_PERCENT) or ((pw_f - logo_rect.right) <= pw_f * NEAR_PERCENT)
+            near_y = (logo_rect.top <= ph_f * NEAR_PERCENT) or ((ph_f - logo_rect.bottom) <= ph_f * NEAR_PERCENT)
+            if (bounced_x and bounced_y) or (near_x and near_y):
+                cx, cy = pw // 2, ph // 2
+                # initialize eased approach
+                approach_active = True
+                approach_elapsed = 0.0
+                approach_start_x = float(logo_rect.x)
+                approach_start_y = float(logo_rect.y)
+                approach_target_x = float(cx - (logo_rect.width // 2))
+                approach_target_y = float(cy - (logo_rect.height // 2))
+                # keep velocities zeroed while we approach
+                vel_x = 0.0
+                vel_y = 0.0
+                # don't play bounce sound for corner hit; it's handled by movement end
+                bounced = False
+            else:
+                bounced = bounced_x or bounced_y
+
+            if bounced:
+                play_bounce()
+
+        draw_frame()
+
+# ---------- Daemon mode ----------
+control = None         # ControlServer while running with --daemon
+daemon_quit = False    # set by a "quit" command
+
+class ControlServer:
+    """Unix-socket command channel for daemon mode.
+
+    Each client connection carries one newline-terminated command
+    ("activate", "deactivate", "ping" or "quit") and gets a one-line reply
+    once the command has been carried out."""
+
+    def __init__(self, path):
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("Unix domain sockets are not available on this platform")
+        self.path = Path(path)
+        try:
+            st = os.lstat(self.path)
+        except FileNotFoundError:
+            st = None
+        if st is not None:
+            if not stat.S_ISSOCK(st.st_mode):
+                raise OSError(f"{self.path} exists and is not a socket")
+            # refuse to steal the socket from a live daemon; clear a stale one
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(self.path))
+                raise OSError(f"another daemon is already listening on {self.path}")
+            except ConnectionRefusedError:
+                self.path.unlink()
+            finally:
+                probe.close()
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # create the socket file owner-only from the start; a chmod after
+        # bind() would leave a window where others could connect
+        old_umask = os.umask(0o177)
+        try:
+            self.sock.bind(str(self.path))
+        finally:
+            os.umask(old_umask)
+        self.sock.listen(4)
+        self.sock.setblocking(False)
+        self.conn = None
+        # accepted connections whose command line hasn't fully arrived yet;
+        # everything is non-blocking so a slow client never stalls a frame
+        self.partial = {}
+
+    def poll(self, timeout=0.0):
+        """Return the next complete command, waiting up to `timeout` seconds
+        for socket activity (None blocks until there is some). Returns None if
+        no command has been completed yet."""
+        if self.conn is not None:
+            # previous command never got an explicit answer
+            self.reply("ok")
+        readable, _, _ = select.select([self.sock] + list(self.partial), [], [], timeout)
+        for sock in readable:
+            if sock is self.sock:
+                self._accept()
+                continue
+            if sock not in self.partial:
+                # evicted (and closed) by _accept() earlier in this pass
+                continue
+            try:
+                chunk = sock.recv(256)
+            except BlockingIOError:
+                continue
+            except OSError:
+                chunk = b""
+            data = self.partial[sock] + chunk
+            if chunk and b"\n" not in data and len(data) < 256:
+                self.partial[sock] = data
+                continue
+            del self.partial[sock]
+            if not data.strip():
+                # client hung up without sending anything
+                sock.close()
+                continue
+            self.conn = sock
+            return data.split(b"\n", 1)[0].decode("utf-8", "replace").strip().lower()
+        return None
+
+    def _accept(self):
+        try:
+            conn, _ = self.sock.accept()
+        except BlockingIOError:
+            return
+        conn.setblocking(False)
+        if len(self.partial) >= 8:
+            # don't let idle connections pile up; drop the oldest
+            oldest = next(iter(self.partial))
+            del self.partial[oldest]
+            oldest.close()
+        self.partial[conn] = b""
+
+    def reply(self, msg):
+        if self.conn is None:
+            return
+        try:
+            self.conn.sendall((msg + "\n").encode("utf-8"))
+        except OSError:
+            pass
+        self.conn.close()
+        self.conn = None
+
+    def close(self):
+        self.reply("ok")
+        for conn in self.partial:
+            conn.close()
+        self.partial.clear()
+        self.sock.close()
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+def poll_control():
+    """Answer a pending daemon command without blocking. Returns True if the
+    current activation should end ("deactivate" or "quit")."""
+    global daemon_quit
+    if control is None:
+        return False
+    cmd = control.poll()
+    if cmd is None:
+        return False
+    if cmd in ("activate", "deactivate", "ping"):
+        control.reply("ok")
+    elif cmd == "quit":
+        daemon_quit = True
+        control.reply("ok")
+    else:
+        control.reply(f"error: unknown command {cmd!r}")
+    return cmd in ("deactivate", "quit")
+
+def warm_caches():
+    """Do all the one-off work an activation would otherwise pay for: scale the
+    images for the sizes we can open at, resample the bounce sound for every
+    speed step and import the video decoder."""
+    sizes = [last_windowed_size]
+    try:
+        sizes.extend(pygame.display.get_desktop_sizes())
+    except Exception:
+        pass
+    for size in sizes:
+        pw, ph, ox, oy = compute_play_area(size)
+        target = pygame.Surface((pw, ph))
+        for src, img in ((bg_src, scale_bg_to_fill(target, bg_src)),
+                         (logo_src, fit_logo_to_window(target, logo_src))):
+            prescaled[(src, img.get_size())] = img
+    if bounce_sfx:
+        # every multiplier the arrow keys can produce, including the capped
+        # ends and the values stepped back from them (e.g. SPEED_MAX / SPEED_STEP)
+        seen = set()
+        todo = [1.0]
+        while todo:
+            mult = todo.pop()
+            if round(mult, 9) in seen:
+                continue
+            seen.add(round(mult, 9))
+            bounce_sound_for(mult)
+            todo.append(min(SPEED_MAX, mult * SPEED_STEP))
+            todo.append(max(SPEED_MIN, mult / SPEED_STEP))
+    try:
+        from moviepy.video.io.VideoFileClip import VideoFileClip  # noqa: F401
+    except Exception:
+        pass
+
+def activate_window():
+    """Show the (already created) window and draw the first frame."""
+    global screen, is_fullscreen, prev_window_size
+    pygame.event.clear()
+    if ARGS.fullscreen:
+        screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN | pygame.DOUBLEBUF | pygame.SHOWN)
+        is_fullscreen = True
+    else:
+        screen = pygame.display.set_mode(last_windowed_size, FLAGS_WINDOWED | pygame.SHOWN)
+        prev_window_size = last_windowed_size
+    restart_game_state()
+    draw_frame()
+
+def deactivate_window():
+    """Silence and hide the window again, leaving everything loaded."""
+    global screen, is_fullscreen
+    if MIXER_OK:
+        pygame.mixer.stop()
+    screen = pygame.display.set_mode(last_windowed_size, FLAGS_WINDOWED | pygame.HIDDEN)
+    is_fullscreen = False
+    pygame.event.clear()
+
+def serve_daemon(path):
+    """Wait on the control socket, running the screensaver on each "activate".
+    Between activations the process sleeps in select() and uses no CPU."""
+    global control, daemon_quit
+    try:
+        control = ControlServer(path)
+    except OSError as e:
+        fail(f"Failed to open control socket {path} : {e}")
+    warm_caches()
+    print(f"Daemon ready, listening on {path}")
+    try:
+        while not daemon_quit:
+            cmd = control.poll(None)
+            if cmd is None:
+                continue
+            if cmd == "activate":
+                started = time.perf_counter()
+                activate_window()
+                control.reply(f"ok first frame in {(time.perf_counter() - started) * 1000.0:.1f} ms")
+                run_screensaver()
+                deactivate_window()
+            elif cmd == "quit":
+                daemon_quit = True
+                control.reply("ok")
+            elif cmd in ("deactivate", "ping"):
+                control.reply("ok")
+            else:
+                control.reply(f"error: unknown command {cmd!r}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        control.close()
+
+if ARGS.daemon:
+    serve_daemon(ARGS.socket)
+else:
+    run_screensaver()
+
+print_pacing_stats()
 pygame.quit()
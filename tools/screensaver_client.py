@@ -0,0 +1,46 @@
+import argparse
+import os
+import socket
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Stand-in for an idle detector: sends commands to `Main/main.py --daemon`.
+#   python tools/screensaver_client.py activate
+#   python tools/screensaver_client.py activate --hold 5   (deactivates after 5s)
+
+DEFAULT_SOCKET = Path(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()) / "daim-bouncer.sock"
+
+parser = argparse.ArgumentParser(description="Send a command to the screensaver daemon")
+parser.add_argument("command", choices=["activate", "deactivate", "ping", "quit"])
+parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET)
+parser.add_argument("--hold", type=float, default=None,
+                    help="after 'activate', wait this many seconds and send 'deactivate'")
+args = parser.parse_args()
+
+
+def send(command):
+    started = time.perf_counter()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(10.0)
+            sock.connect(str(args.socket))
+            sock.sendall((command + "\n").encode("utf-8"))
+            reply = b""
+            while not reply.endswith(b"\n"):
+                chunk = sock.recv(256)
+                if not chunk:
+                    break
+                reply += chunk
+    except OSError as e:
+        print(f"{command}: failed to reach daemon at {args.socket}: {e}")
+        sys.exit(1)
+    elapsed = (time.perf_counter() - started) * 1000.0
+    print(f"{command}: {reply.decode('utf-8', 'replace').strip()} (round trip {elapsed:.1f} ms)")
+
+
+send(args.command)
+if args.command == "activate" and args.hold is not None:
+    time.sleep(args.hold)
+    send("deactivate")